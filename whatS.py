@@ -4,19 +4,54 @@
 # Descripción: Herramienta para consultar información de números de WhatsApp
 # ============================================================================
 
+import asyncio
+import atexit
+import functools
 import os
 import re
 import sys
 import json
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional, List
-from pathlib import Path
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
+from typing import Dict, Any, Optional, List, Tuple
 
 # Dependencias externas
-import requests
-from dotenv import load_dotenv
-from colorama import Fore, Style, init, Back
+# `requests` y `dotenv` se importan de forma diferida dentro de los métodos
+# que los usan: arrastran dependencias pesadas (urllib3, certifi, ...) que
+# retrasan el arranque y que las opciones de menú sin red nunca necesitan.
+from colorama import Fore, Style, init
+
+# Acelerador opcional: orjson (Rust) serializa/parsea JSON varias veces más
+# rápido que el módulo estándar. Si no está instalado se usa json de stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Acelerador opcional: aiohttp habilita la consulta por lotes con peticiones
+# HTTP concurrentes. Sin él, la opción de lotes del menú queda deshabilitada.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Acelerador opcional: httpx con HTTP/2 multiplexa las consultas repetidas
+# sobre una sola conexión TLS y comprime las cabeceras RapidAPI constantes
+# (HPACK). Requiere el extra httpx[http2]; sin él se usa requests.
+try:
+    import httpx
+    import h2  # noqa: F401 — http2=True necesita el paquete h2
+except ImportError:
+    httpx = None
+
+# Acelerador opcional: NumPy vectoriza la validación de lotes grandes de
+# números (opción 6). Sin él se valida número a número en Python puro.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # ============================================================================
 # CONFIGURACIÓN Y CONSTANTES
@@ -31,18 +66,238 @@ LOG_FILE: str = 'whatSPY.log'
 MAX_LOG_LINES: int = 20
 MIN_PHONE_LENGTH: int = 10
 MAX_PHONE_LENGTH: int = 15
+CACHE_TTL: int = 300  # Segundos de validez de una respuesta en caché
+NEG_CACHE_TTL: int = 60  # TTL más corto para resultados negativos (404/410)
+
+# Colores precalculados para el renderizado de JSON: evita repetir las
+# búsquedas de atributos de colorama en cada nodo.
+_C_KEY = Fore.CYAN
+_C_IDX = Fore.MAGENTA
+_C_BOOL = Fore.GREEN
+_C_VAL = Fore.YELLOW
+_RST = Style.RESET_ALL
+
+# Sangrías precalculadas por nivel de anidación
+_INDENTS = tuple("    " * i for i in range(16))
+
+# Clasificador de líneas de log: el formato lo controla este mismo módulo,
+# así que basta una búsqueda del token de nivel y un lookup en dict en vez
+# de varios escaneos 'in' encadenados por línea.
+_LEVEL_RE = re.compile(r' - (ERROR|CRITICAL|WARNING|INFO) - ')
+_LEVEL_STYLE = {
+    'ERROR': (Fore.RED, "❌"),
+    'CRITICAL': (Fore.RED, "❌"),
+    'WARNING': (Fore.YELLOW, "⚠️"),
+    'INFO': (Fore.GREEN, "ℹ️"),
+}
+_DEFAULT_LEVEL_STYLE = (Fore.WHITE, "📝")
+
+# Tabla de traducción para eliminar separadores de números. str.translate
+# corre en C en una sola pasada, sin invocar el motor de expresiones regulares.
+_PHONE_STRIP_TABLE = str.maketrans('', '', ' -()+\t')
+
+
+@functools.lru_cache(maxsize=256)
+def _strip_phone(phone_number: str) -> str:
+    """Eliminar separadores de un número (memoizado para entradas repetidas)."""
+    return phone_number.translate(_PHONE_STRIP_TABLE)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_numba_validator():
+    """
+    Compilar (una sola vez) el validador masivo de dígitos con Numba.
+
+    El import de numba y la compilación JIT tardan varios segundos, así que
+    solo se pagan la primera vez que se valida un archivo masivo; con
+    cache=True el binario compilado se reutiliza entre ejecuciones. Devuelve
+    None si numba o numpy no están instalados.
+    """
+    if np is None:
+        return None
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def _validate_digits(buf, starts, ends, min_len, max_len):
+        n = starts.size
+        out = np.zeros(n, np.bool_)
+        for i in range(n):
+            start = starts[i]
+            end = ends[i]
+            length = end - start
+            if length < min_len or length > max_len:
+                continue
+            ok = True
+            for j in range(start, end):
+                c = buf[j]
+                if c < 0x30 or c > 0x39:
+                    ok = False
+                    break
+            out[i] = ok
+        return out
 
-# Configurar sistema de logging
+    return _validate_digits
+
+
+@functools.lru_cache(maxsize=1)
+def _http_exceptions():
+    """
+    Tuplas de excepciones (HTTP, timeout, conexión) del cliente HTTP activo.
+
+    Se resuelven una sola vez para no decidir entre httpx y requests en
+    cada consulta.
+    """
+    if httpx is not None:
+        return (
+            (httpx.HTTPStatusError,),
+            (httpx.TimeoutException,),
+            (httpx.TransportError,)
+        )
+    import requests
+    return (
+        (requests.exceptions.HTTPError,),
+        (requests.exceptions.Timeout,),
+        (requests.exceptions.ConnectionError,)
+    )
+
+
+def _tail(path: str, n_lines: int, chunk: int = 4096) -> List[bytes]:
+    """
+    Leer las últimas n_lines líneas de un archivo sin cargarlo completo.
+
+    Retrocede desde el final del archivo en bloques de `chunk` bytes hasta
+    reunir las líneas pedidas, por lo que el costo depende del tamaño de la
+    ventana y no del tamaño del archivo.
+
+    Args:
+        path (str): Ruta del archivo a leer
+        n_lines (int): Cantidad de líneas finales a devolver
+        chunk (int): Tamaño de bloque de lectura en bytes
+
+    Returns:
+        List[bytes]: Las últimas líneas del archivo, sin decodificar
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        data = b''
+        while size > 0 and data.count(b'\n') <= n_lines:
+            read_size = min(chunk, size)
+            size -= read_size
+            f.seek(size)
+            data = f.read(read_size) + data
+        return data.splitlines()[-n_lines:]
+
+# Configurar sistema de logging. Los registros se encolan y un hilo de
+# fondo (QueueListener) hace las escrituras a disco/consola, de modo que
+# el hilo principal no bloquee en I/O durante las consultas.
+_log_queue: SimpleQueue = SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# El archivo rota al alcanzar ~512 KB (3 respaldos), así que ni los appends
+# ni show_logs pagan por un log que crece sin límite; la consola solo
+# muestra advertencias y errores.
+_console_handler = logging.StreamHandler()
+_console_handler.setLevel(logging.WARNING)
+_log_listener = QueueListener(
+    _log_queue,
+    RotatingFileHandler(LOG_FILE, maxBytes=512_000, backupCount=3, encoding='utf-8'),
+    _console_handler,
+    respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# ============================================================================
+# TEXTOS ESTÁTICOS DE LA INTERFAZ
+# ============================================================================
+# Se construyen una sola vez al importar el módulo: las cadenas no varían
+# entre iteraciones del menú, así que no hay que reformatearlas en cada ciclo.
+
+_BANNER = f"""
+{Fore.CYAN}{Style.BRIGHT}
+██╗    ██╗██╗  ██╗ █████╗ ████████╗███████╗██████╗ ██╗   ██╗
+██║    ██║██║  ██║██╔══██╗╚══██╔══╝██╔════╝██╔══██╗╚██╗ ██╔╝
+██║ █╗ ██║███████║███████║   ██║   ███████╗██████╔╝ ╚████╔╝
+██║███╗██║██╔══██║██╔══██║   ██║   ╚════██║██╔═══╝   ╚██╔╝
+╚███╔███╔╝██║  ██║██║  ██║   ██║   ███████║██║        ██║
+ ╚══╝╚══╝ ╚═╝  ╚═╝╚═╝  ╚═╝   ╚═╝   ╚══════╝╚═╝        ╚═╝
+
+{Fore.YELLOW}WhatsApp Number Intelligence Tool{Style.RESET_ALL}
+
+{Fore.WHITE}Desarrollado por: {Fore.RED}B4sal{Style.RESET_ALL}
+
+{Fore.CYAN}Funciones principales:{Style.RESET_ALL}
+{Fore.CYAN}• Consulta información detallada de números WhatsApp{Style.RESET_ALL}
+{Fore.CYAN}• Exporta resultados en formato JSON{Style.RESET_ALL}
+{Fore.CYAN}• Sistema de logs completo{Style.RESET_ALL}
+{Fore.CYAN}• Interfaz colorida y fácil de usar{Style.RESET_ALL}
+        """
+
+# Banner pre-codificado a UTF-8: escribirlo al buffer binario de stdout se
+# salta la capa de texto de print() en cada redibujado.
+_BANNER_BYTES = (_BANNER + '\n').encode('utf-8')
+
+_MENU = f"""
+{Fore.CYAN}{Style.BRIGHT}MENÚ PRINCIPAL{Style.RESET_ALL}
+
+{Fore.YELLOW}1.{Fore.WHITE} Consultar número de WhatsApp
+{Fore.YELLOW}2.{Fore.WHITE} Consultar y guardar resultado
+{Fore.YELLOW}3.{Fore.WHITE} Ver logs del sistema
+{Fore.YELLOW}4.{Fore.WHITE} Limpiar pantalla
+{Fore.YELLOW}5.{Fore.WHITE} Ver ayuda y documentación
+{Fore.YELLOW}6.{Fore.WHITE} Consulta por lotes desde archivo
+{Fore.YELLOW}7.{Fore.WHITE} Limpiar caché de consultas
+
+{Fore.RED}0.{Fore.WHITE} Salir del programa
+{Style.RESET_ALL}"""
+
+_HELP = f"""
+{Fore.CYAN}{Style.BRIGHT}GUÍA DE USO - WHATSPY{Style.RESET_ALL}
+
+{Fore.YELLOW}FORMATO DE NÚMEROS VÁLIDOS:{Style.RESET_ALL}
+
+  • {Fore.GREEN}Con código de país:{Fore.WHITE} +52 55 1234 5678, +1 555 123 4567
+  • {Fore.GREEN}Sin espacios:{Fore.WHITE} 5215512345678
+  • {Fore.GREEN}Con paréntesis:{Fore.WHITE} (555) 123-4567
+
+{Fore.YELLOW}CONFIGURACIÓN REQUERIDA:{Style.RESET_ALL}
+
+  1. Crear archivo {Fore.MAGENTA}.env{Style.RESET_ALL} en el directorio del proyecto
+  2. Añadir las siguientes variables:
+     {Fore.GREEN}RAPIDAPI_KEY={Fore.WHITE}tu_clave_api_aqui
+     {Fore.GREEN}RAPIDAPI_HOST={Fore.WHITE}whatsapp-data.p.rapidapi.com
+
+{Fore.YELLOW}ARCHIVOS GENERADOS:{Style.RESET_ALL}
+
+  • {Fore.MAGENTA}whatSPY.log{Fore.WHITE} - Registro detallado de actividades
+  • {Fore.MAGENTA}whatsapp_data_*.json{Fore.WHITE} - Resultados de consultas
+
+{Fore.YELLOW}FUNCIONALIDADES PRINCIPALES:{Style.RESET_ALL}
+
+  ✅ Validación automática de números de teléfono
+  ✅ Formato JSON con colores para mejor lectura
+  ✅ Guardado automático de resultados
+  ✅ Sistema de logging completo
+  ✅ Manejo robusto de errores de red
+  ✅ Interfaz colorida y fácil de usar
+
+{Fore.YELLOW}CONSEJOS:{Style.RESET_ALL}
+
+  • Siempre incluye el código de país en el número
+  • Revisa los logs si encuentras errores
+  • Los resultados se guardan automáticamente con timestamp
+{Style.RESET_ALL}
+        """
+
 class WhatSPY:
     """
     WhatSPY - WhatsApp Number Intelligence Tool
@@ -69,24 +324,94 @@ class WhatSPY:
         
         Carga las variables de entorno y prepara la configuración necesaria
         para realizar consultas a la API de WhatsApp Data.
-        
+
         Raises:
             SystemExit: Si no se encuentran las variables de entorno requeridas.
         """
         self.load_environment()
-        
+
+        # La sesión HTTP se crea de forma diferida en la primera consulta
+        # (ver _get_session) para no pagar el import de requests al arrancar.
+        self.session = None
+
+        # Caché en memoria indexada por número formateado, con entradas
+        # (timestamp, status HTTP, datos). Los aciertos positivos valen
+        # CACHE_TTL; los negativos (404/410, datos None) solo NEG_CACHE_TTL.
+        # La consulta más rápida es la que no se hace, pero los datos no
+        # deben quedar obsoletos.
+        self._cache: Dict[str, Tuple[float, int, Optional[Dict[str, Any]]]] = {}
+
+    def _get_session(self) -> Any:
+        """
+        Obtener el cliente HTTP persistente, creándolo en el primer uso.
+
+        Con httpx[http2] instalado se usa un cliente HTTP/2 que multiplexa
+        las consultas sobre una sola conexión TLS; si no, una sesión de
+        requests con keep-alive y reintentos ante errores 5xx transitorios.
+        Se construye aquí y no en __init__ para diferir el import del
+        cliente hasta la primera consulta real.
+
+        Returns:
+            httpx.Client | requests.Session: Cliente con las cabeceras de
+            RapidAPI fijadas
+        """
+        if self.session is None:
+            headers = {
+                "x-rapidapi-key": self.api_key,
+                "x-rapidapi-host": self.api_host,
+                "User-Agent": "WhatSPY/2.0 (https://github.com/B4sal/whatS.PY)"
+            }
+            if httpx is not None:
+                self.session = httpx.Client(
+                    http2=True,
+                    headers=headers,
+                    timeout=API_TIMEOUT,
+                    limits=httpx.Limits(max_keepalive_connections=5)
+                )
+            else:
+                import requests
+                from requests.adapters import HTTPAdapter, Retry
+
+                self.session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=10,
+                    max_retries=Retry(
+                        total=2,
+                        backoff_factor=0.3,
+                        status_forcelist=(502, 503, 504)
+                    )
+                )
+                self.session.mount('https://', adapter)
+                self.session.headers.update(headers)
+        return self.session
+
+    def close(self) -> None:
+        """Cerrar el cliente HTTP persistente, si llegó a crearse."""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    def __enter__(self) -> "WhatSPY":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def load_environment(self) -> None:
         """
         Cargar las variables de entorno desde el archivo .env.
-        
+
         Busca y carga el archivo .env que debe contener:
         - RAPIDAPI_KEY: Clave de la API de RapidAPI
         - RAPIDAPI_HOST: Host de la API de WhatsApp Data
-        
+
         Raises:
             SystemExit: Si las variables requeridas no están definidas.
         """
         try:
+            from dotenv import load_dotenv
+
             load_dotenv()
             self.api_key = os.getenv('RAPIDAPI_KEY')
             self.api_host = os.getenv('RAPIDAPI_HOST')
@@ -96,6 +421,10 @@ class WhatSPY:
                     "❌ Las variables de entorno RAPIDAPI_KEY y RAPIDAPI_HOST son requeridas."
                 )
                 
+            # Prefijo de URL precalculado: el host no cambia entre consultas,
+            # así que cada petición solo concatena el número
+            self._url_prefix = f"https://{self.api_host}/number/"
+
             logger.info("✅ Variables de entorno cargadas correctamente.")
             
         except Exception as e:
@@ -129,20 +458,89 @@ class WhatSPY:
         """
         if not phone_number or not isinstance(phone_number, str):
             return False
-            
-        # Remover espacios y caracteres especiales
-        cleaned_number = re.sub(r'[\s\-\(\)\+]', '', phone_number)
-        
-        # Verificar que contenga solo dígitos
-        if not cleaned_number.isdigit():
+
+        # Cotas sobre la longitud cruda: limpiar solo quita caracteres, así
+        # que una cadena más corta que el mínimo nunca validará, y el tope
+        # (máximo + 8 separadores) descarta entradas absurdamente largas a
+        # costo constante, antes de limpiar y de pasar por la caché.
+        raw_length = len(phone_number)
+        if raw_length < MIN_PHONE_LENGTH or raw_length > MAX_PHONE_LENGTH + 8:
             return False
-            
-        # Verificar longitud según estándares internacionales E.164
-        if len(cleaned_number) < MIN_PHONE_LENGTH or len(cleaned_number) > MAX_PHONE_LENGTH:
+
+        # Remover espacios y caracteres especiales
+        cleaned_number = _strip_phone(phone_number)
+
+        # Comprobar primero la longitud E.164 (O(1)): la mayoría de las
+        # entradas inválidas se descartan sin recorrer los caracteres
+        if not MIN_PHONE_LENGTH <= len(cleaned_number) <= MAX_PHONE_LENGTH:
             return False
-            
-        return True
+
+        # Verificar que contenga solo dígitos
+        return cleaned_number.isdigit()
     
+    def validate_many(self, phone_numbers: List[str]) -> List[bool]:
+        """
+        Validar una lista de números de teléfono en lote.
+
+        Con NumPy instalado, el filtro de longitud E.164 se vectoriza sobre
+        un arreglo contiguo y el escaneo de dígitos solo se hace para los
+        candidatos que lo superan; sin NumPy se valida número a número.
+
+        Args:
+            phone_numbers (List[str]): Números de teléfono a validar
+
+        Returns:
+            List[bool]: Resultado de validación por número, en orden
+        """
+        if np is None:
+            return [self.validate_phone_number(p) for p in phone_numbers]
+
+        cleaned = [
+            p.translate(_PHONE_STRIP_TABLE) if isinstance(p, str) else ''
+            for p in phone_numbers
+        ]
+        lengths = np.fromiter(map(len, cleaned), dtype=np.int32, count=len(cleaned))
+        length_ok = (lengths >= MIN_PHONE_LENGTH) & (lengths <= MAX_PHONE_LENGTH)
+        return [
+            bool(ok) and number.isdigit()
+            for ok, number in zip(length_ok, cleaned)
+        ]
+
+    def validate_file(self, file_path: str) -> List[bool]:
+        """
+        Validar de forma masiva los números listados en un archivo.
+
+        Pensado para datasets grandes fuera del flujo interactivo (millones
+        de líneas): con Numba y NumPy instalados, los dígitos se comprueban
+        con un bucle compilado sobre un único buffer de bytes; sin ellos se
+        delega en validate_many.
+
+        Args:
+            file_path (str): Ruta del archivo con un número por línea
+
+        Returns:
+            List[bool]: Resultado de validación por línea no vacía, en orden
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            phones = [line.strip() for line in f if line.strip()]
+
+        validator = _get_numba_validator()
+        if validator is None:
+            return self.validate_many(phones)
+
+        # Concatenar todos los números limpios en un solo buffer contiguo;
+        # los caracteres no ASCII se sustituyen por '?' y fallan el chequeo
+        encoded = [
+            p.translate(_PHONE_STRIP_TABLE).encode('ascii', errors='replace')
+            for p in phones
+        ]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        mask = validator(buf, starts, ends, MIN_PHONE_LENGTH, MAX_PHONE_LENGTH)
+        return [bool(flag) for flag in mask]
+
     def format_phone_number(self, phone_number: str) -> str:
         """
         Formatear número de teléfono removiendo caracteres especiales.
@@ -153,33 +551,80 @@ class WhatSPY:
         Returns:
             str: Número formateado
         """
-        return re.sub(r'[\s\-\(\)\+]', '', phone_number)
+        return _strip_phone(phone_number)
     
     def print_colored_json(self, data: Any, level: int = 0) -> None:
         """
         Imprimir JSON con formato y colores.
-        
+
+        Acumula todo el texto en memoria y lo emite con una sola escritura
+        a stdout, en lugar de un print() por nodo.
+
         Args:
             data: Datos a imprimir
-            level (int): Nivel de indentación
+            level (int): Nivel de indentación inicial
         """
-        indent = "    " * level
-        
-        if isinstance(data, dict):
-            for key, value in data.items():
-                print(f"{indent}{Fore.CYAN}{key}{Style.RESET_ALL}: ", end="")
-                if isinstance(value, (dict, list)):
-                    print()
-                    self.print_colored_json(value, level + 1)
-                else:
-                    self.print_colored_json(value, 0)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                print(f"{indent}{Fore.MAGENTA}[{i}]{Style.RESET_ALL}")
-                self.print_colored_json(item, level + 1)
-        else:
-            color = Fore.GREEN if isinstance(data, bool) else Fore.YELLOW
-            print(f"{color}{data}{Style.RESET_ALL}")
+        # Ruta rápida: la mayoría de las respuestas de la API son dicts
+        # planos {clave: escalar}, que se pueden emitir sin recursión
+        if (
+            level == 0
+            and isinstance(data, dict)
+            and data
+            and all(not isinstance(v, (dict, list)) for v in data.values())
+        ):
+            lines = [
+                f"{_C_KEY}{key}{_RST}: "
+                f"{_C_BOOL if isinstance(value, bool) else _C_VAL}{value}{_RST}"
+                for key, value in data.items()
+            ]
+            sys.stdout.write('\n'.join(lines) + '\n')
+            return
+
+        fragments: List[str] = []
+        self._render_colored_json(data, level, fragments)
+        sys.stdout.write(''.join(fragments))
+
+    def _render_colored_json(self, data: Any, level: int, out: List[str]) -> None:
+        """
+        Acumular los fragmentos coloreados de un nodo JSON en `out`.
+
+        Recorre la estructura con una pila explícita en lugar de recursión:
+        evita el costo de una llamada de Python por nodo y el límite de
+        profundidad del intérprete en respuestas muy anidadas.
+
+        Args:
+            data: Nodo a renderizar
+            level (int): Nivel de indentación inicial
+            out (List[str]): Lista destino de fragmentos
+        """
+        # La pila mezcla nodos pendientes (tuplas nodo/nivel) con fragmentos
+        # ya formateados (str); se apila en orden inverso para emitir igual
+        # que la versión recursiva.
+        stack: List[Any] = [(data, level)]
+        while stack:
+            frame = stack.pop()
+            if isinstance(frame, str):
+                out.append(frame)
+                continue
+
+            node, lvl = frame
+            indent = _INDENTS[lvl] if lvl < len(_INDENTS) else "    " * lvl
+
+            if isinstance(node, dict):
+                for key, value in reversed(list(node.items())):
+                    if isinstance(value, (dict, list)):
+                        stack.append((value, lvl + 1))
+                        stack.append(f"{indent}{_C_KEY}{key}{_RST}: \n")
+                    else:
+                        stack.append((value, 0))
+                        stack.append(f"{indent}{_C_KEY}{key}{_RST}: ")
+            elif isinstance(node, list):
+                for i in range(len(node) - 1, -1, -1):
+                    stack.append((node[i], lvl + 1))
+                    stack.append(f"{indent}{_C_IDX}[{i}]{_RST}\n")
+            else:
+                color = _C_BOOL if isinstance(node, bool) else _C_VAL
+                out.append(f"{color}{node}{_RST}\n")
     
     def save_result_to_file(self, data: Dict[str, Any], phone_number: str) -> None:
         """
@@ -189,17 +634,30 @@ class WhatSPY:
             data: Datos a guardar
             phone_number: Número de teléfono consultado
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"whatsapp_data_{phone_number}_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # Un solo os.write del blob de bytes UTF-8: sin cadena
+                # intermedia ni capa de buffering de Python
+                payload = orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                )
+                fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             print(f"{Fore.GREEN}Resultado guardado en: {filename}{Style.RESET_ALL}")
-            logger.info(f"Resultado guardado en archivo: {filename}")
+            logger.info("Resultado guardado en archivo: %s", filename)
         except Exception as e:
             print(f"{Fore.RED}Error al guardar archivo: {e}{Style.RESET_ALL}")
-            logger.error(f"Error al guardar archivo: {e}")
+            logger.error("Error al guardar archivo: %s", e)
     
     def query_whatsapp_number(self, phone_number: str, save_to_file: bool = False) -> Optional[Dict[str, Any]]:
         """
@@ -220,34 +678,63 @@ class WhatSPY:
         """
         # Formatear y validar número
         formatted_number = self.format_phone_number(phone_number)
-        
-        # Preparar la consulta
-        url = f"https://{self.api_host}/number/{formatted_number}"
-        headers = {
-            "x-rapidapi-key": self.api_key,
-            "x-rapidapi-host": self.api_host,
-            "User-Agent": "WhatSPY/2.0 (https://github.com/B4sal/whatS.PY)"
-        }
-        
+
+        # Respuesta en caché aún vigente: evita repetir el viaje de red
+        cached = self._cache.get(formatted_number)
+        if cached is not None:
+            cached_at, cached_status, data = cached
+            ttl = CACHE_TTL if data is not None else NEG_CACHE_TTL
+            if time.monotonic() - cached_at < ttl:
+                if data is not None:
+                    print(f"\n{Fore.GREEN}⚡ Resultado obtenido de la caché para: {Fore.CYAN}{phone_number}{Style.RESET_ALL}\n")
+                    self.print_colored_json(data)
+                    if save_to_file:
+                        self.save_result_to_file(data, formatted_number)
+                    logger.info("Respuesta servida desde caché para: %s", phone_number)
+                    return data
+                # Resultado negativo reciente: no vale la pena volver a pedirlo
+                print(f"\n{Fore.YELLOW}⚡ Sin datos para {phone_number} "
+                      f"(HTTP {cached_status}, resultado negativo en caché){Style.RESET_ALL}")
+                logger.info("Resultado negativo servido desde caché para: %s", phone_number)
+                return None
+            # Entrada vencida: se elimina y se consulta de nuevo
+            del self._cache[formatted_number]
+
+        # Preparar la consulta (las cabeceras ya están fijadas en la sesión)
+        url = self._url_prefix + formatted_number
+
         # Mostrar información de la consulta
         print(f"\n{Fore.CYAN}{'═' * 60}")
         print(f"🔍 {Fore.WHITE}CONSULTANDO NÚMERO: {Fore.YELLOW}{phone_number}")
         print(f"🌐 {Fore.WHITE}ENDPOINT: {Fore.BLUE}{url}")
         print(f"{Fore.CYAN}{'═' * 60}{Style.RESET_ALL}")
         
+        # Excepciones del cliente HTTP activo (httpx o requests)
+        http_errors, timeout_errors, connection_errors = _http_exceptions()
+
+        # Inicialización explícita: el manejador de errores HTTP puede así
+        # comprobar `is not None` en lugar de materializar locals()
+        response: Optional[Any] = None
+
         try:
             # Realizar solicitud con timeout
             print(f"{Fore.YELLOW}⏳ Realizando consulta a la API...{Style.RESET_ALL}")
-            response = requests.get(url, headers=headers, timeout=API_TIMEOUT)
+            response = self._get_session().get(url, timeout=API_TIMEOUT)
             
             # Log del estado de la respuesta
-            logger.info(f"📡 Respuesta HTTP: {response.status_code} para {phone_number}")
+            logger.info("📡 Respuesta HTTP: %s para %s", response.status_code, phone_number)
             
             # Verificar status code
             response.raise_for_status()
             
-            # Procesar respuesta JSON
-            data = response.json()
+            # Procesar respuesta JSON (orjson parsea los bytes directamente)
+            if orjson is not None:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
+
+            # Guardar en caché (solo respuestas exitosas) para consultas repetidas
+            self._cache[formatted_number] = (time.monotonic(), response.status_code, data)
             
             # Mostrar resultado exitoso
             print(f"\n{Fore.GREEN}{'🎉' * 20}")
@@ -261,19 +748,23 @@ class WhatSPY:
             if save_to_file:
                 self.save_result_to_file(data, formatted_number)
             
-            logger.info(f"✅ Consulta exitosa completada para: {phone_number}")
+            logger.info("✅ Consulta exitosa completada para: %s", phone_number)
             return data
             
-        except requests.exceptions.HTTPError as http_err:
-            status_code = response.status_code if 'response' in locals() else 'Unknown'
-            self._handle_http_error(http_err, status_code, phone_number, response if 'response' in locals() else None)
-            
-        except requests.exceptions.Timeout:
+        except http_errors as http_err:
+            status_code = response.status_code if response is not None else 'Unknown'
+            self._handle_http_error(http_err, status_code, phone_number, response)
+            # Cachear solo negativos definitivos; los 429/5xx y errores de
+            # autenticación son transitorios y deben reintentarse
+            if status_code in (404, 410):
+                self._cache[formatted_number] = (time.monotonic(), status_code, None)
+
+        except timeout_errors:
             error_msg = f"⏰ Timeout: La consulta para {phone_number} tardó más de {API_TIMEOUT} segundos"
             print(f"{Fore.RED}❌ {error_msg}{Style.RESET_ALL}")
             logger.error(error_msg)
             
-        except requests.exceptions.ConnectionError:
+        except connection_errors:
             error_msg = f"🌐 Error de conexión al consultar {phone_number}. Verifica tu conexión a internet"
             print(f"{Fore.RED}❌ {error_msg}{Style.RESET_ALL}")
             logger.error(error_msg)
@@ -290,8 +781,117 @@ class WhatSPY:
         
         return None
     
-    def _handle_http_error(self, http_err: requests.exceptions.HTTPError, status_code: int, 
-                          phone_number: str, response: Optional[requests.Response]) -> None:
+    async def _query_one(self, session: "aiohttp.ClientSession", phone_number: str) -> Dict[str, Any]:
+        """
+        Consultar un número dentro de una sesión aiohttp compartida.
+
+        Args:
+            session: Sesión aiohttp con las cabeceras de RapidAPI
+            phone_number (str): Número de teléfono a consultar
+
+        Returns:
+            Dict[str, Any]: Información del número
+        """
+        url = self._url_prefix + self.format_phone_number(phone_number)
+        timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+        async with session.get(url, timeout=timeout) as response:
+            response.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(await response.read())
+            return await response.json()
+
+    async def query_many(self, phone_numbers: List[str], concurrency: int = 8) -> List[Any]:
+        """
+        Consultar varios números de forma concurrente con aiohttp.
+
+        Las N consultas comparten un mismo pool de conexiones y un semáforo
+        acota cuántas están en vuelo, por lo que el tiempo total se acerca
+        al de la consulta más lenta sin desbordar el límite de la API. Los
+        números con respuesta en caché vigente se resuelven sin tocar la red.
+
+        Args:
+            phone_numbers (List[str]): Números de teléfono a consultar
+            concurrency (int): Máximo de consultas simultáneas en vuelo
+
+        Returns:
+            List[Any]: Resultado (o excepción) por cada número, en orden
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+        headers = {
+            "x-rapidapi-key": self.api_key,
+            "x-rapidapi-host": self.api_host,
+            "User-Agent": "WhatSPY/2.0 (https://github.com/B4sal/whatS.PY)"
+        }
+
+        async def _bounded(phone: str) -> Dict[str, Any]:
+            formatted = self.format_phone_number(phone)
+            cached = self._cache.get(formatted)
+            if (
+                cached is not None
+                and cached[2] is not None
+                and time.monotonic() - cached[0] < CACHE_TTL
+            ):
+                return cached[2]
+            async with semaphore:
+                data = await self._query_one(session, phone)
+            self._cache[formatted] = (time.monotonic(), 200, data)
+            return data
+
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            tasks = [_bounded(phone) for phone in phone_numbers]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def clear_cache(self) -> None:
+        """Vaciar la caché de consultas en memoria."""
+        entries = len(self._cache)
+        self._cache.clear()
+        print(f"{Fore.GREEN}🧹 Caché vaciada ({entries} entradas eliminadas).{Style.RESET_ALL}")
+        logger.info("Caché de consultas vaciada: %s entradas", entries)
+
+    def batch_query_from_file(self, file_path: str) -> None:
+        """
+        Consultar en lote los números listados en un archivo (uno por línea).
+
+        Args:
+            file_path (str): Ruta del archivo con los números
+        """
+        if aiohttp is None:
+            print(f"{Fore.RED}❌ La consulta por lotes requiere aiohttp. "
+                  f"Instálalo con: pip install aiohttp{Style.RESET_ALL}")
+            return
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                phones = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            print(f"{Fore.RED}❌ No se pudo leer el archivo: {e}{Style.RESET_ALL}")
+            return
+
+        validity = self.validate_many(phones)
+        valid_phones = [p for p, ok in zip(phones, validity) if ok]
+        invalid_count = len(phones) - len(valid_phones)
+        if invalid_count:
+            print(f"{Fore.YELLOW}⚠️ Se omitieron {invalid_count} números con formato inválido.{Style.RESET_ALL}")
+        if not valid_phones:
+            print(f"{Fore.RED}❌ El archivo no contiene números válidos.{Style.RESET_ALL}")
+            return
+
+        print(f"{Fore.YELLOW}⏳ Consultando {len(valid_phones)} números en paralelo...{Style.RESET_ALL}")
+        results = asyncio.run(self.query_many(valid_phones))
+
+        for phone, result in zip(valid_phones, results):
+            print(f"\n{Fore.CYAN}{'═' * 60}")
+            print(f"📱 {Fore.WHITE}NÚMERO: {Fore.YELLOW}{phone}{Style.RESET_ALL}")
+            if isinstance(result, Exception):
+                print(f"{Fore.RED}❌ Error en la consulta: {result}{Style.RESET_ALL}")
+                logger.error("Error en consulta por lotes para %s: %s", phone, result)
+            else:
+                self.print_colored_json(result)
+        logger.info("Consulta por lotes completada: %s números", len(valid_phones))
+
+    def _handle_http_error(self, http_err: Exception, status_code: int,
+                          phone_number: str, response: Optional[Any]) -> None:
         """
         Manejar errores HTTP de forma detallada.
         
@@ -308,7 +908,10 @@ class WhatSPY:
         # Mostrar detalles del error si están disponibles
         if response:
             try:
-                error_detail = response.json()
+                if orjson is not None:
+                    error_detail = orjson.loads(response.content)
+                else:
+                    error_detail = response.json()
                 print(f"\n{Fore.YELLOW}📋 Detalles del error:{Style.RESET_ALL}")
                 self.print_colored_json(error_detail)
             except (json.JSONDecodeError, ValueError):
@@ -317,26 +920,12 @@ class WhatSPY:
     
     def show_banner(self) -> None:
         """Mostrar banner de la aplicación con estilo mejorado."""
-        banner = f"""
-{Fore.CYAN}{Style.BRIGHT}
-██╗    ██╗██╗  ██╗ █████╗ ████████╗███████╗██████╗ ██╗   ██╗
-██║    ██║██║  ██║██╔══██╗╚══██╔══╝██╔════╝██╔══██╗╚██╗ ██╔╝
-██║ █╗ ██║███████║███████║   ██║   ███████╗██████╔╝ ╚████╔╝ 
-██║███╗██║██╔══██║██╔══██║   ██║   ╚════██║██╔═══╝   ╚██╔╝  
-╚███╔███╔╝██║  ██║██║  ██║   ██║   ███████║██║        ██║   
- ╚══╝╚══╝ ╚═╝  ╚═╝╚═╝  ╚═╝   ╚═╝   ╚══════╝╚═╝        ╚═╝   
-
-{Fore.YELLOW}WhatsApp Number Intelligence Tool{Style.RESET_ALL}
-
-{Fore.WHITE}Desarrollado por: {Fore.RED}B4sal{Style.RESET_ALL}
-
-{Fore.CYAN}Funciones principales:{Style.RESET_ALL}
-{Fore.CYAN}• Consulta información detallada de números WhatsApp{Style.RESET_ALL}
-{Fore.CYAN}• Exporta resultados en formato JSON{Style.RESET_ALL}
-{Fore.CYAN}• Sistema de logs completo{Style.RESET_ALL}
-{Fore.CYAN}• Interfaz colorida y fácil de usar{Style.RESET_ALL}
-        """
-        print(banner)
+        if hasattr(sys.stdout, 'buffer'):
+            sys.stdout.buffer.write(_BANNER_BYTES)
+            sys.stdout.flush()
+        else:
+            # stdout redirigido a un objeto sin buffer binario
+            print(_BANNER)
     
     def show_menu(self) -> int:
         """
@@ -345,16 +934,8 @@ class WhatSPY:
         Returns:
             int: Opción seleccionada por el usuario
         """
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}MENÚ PRINCIPAL{Style.RESET_ALL}\n")
-        print(f"{Fore.YELLOW}1.{Fore.WHITE} Consultar número de WhatsApp")
-        print(f"{Fore.YELLOW}2.{Fore.WHITE} Consultar y guardar resultado") 
-        print(f"{Fore.YELLOW}3.{Fore.WHITE} Ver logs del sistema")
-        print(f"{Fore.YELLOW}4.{Fore.WHITE} Limpiar pantalla")
-        print(f"{Fore.YELLOW}5.{Fore.WHITE} Ver ayuda y documentación")
-        print()
-        print(f"{Fore.RED}0.{Fore.WHITE} Salir del programa")
-        print(f"{Style.RESET_ALL}")
-        
+        print(_MENU)
+
         try:
             choice = int(input(f"{Fore.GREEN}Selecciona una opción: {Style.RESET_ALL}"))
             return choice
@@ -364,66 +945,27 @@ class WhatSPY:
     
     def show_help(self) -> None:
         """Mostrar ayuda del programa con diseño mejorado."""
-        help_text = f"""
-{Fore.CYAN}{Style.BRIGHT}GUÍA DE USO - WHATSPY{Style.RESET_ALL}
-
-{Fore.YELLOW}FORMATO DE NÚMEROS VÁLIDOS:{Style.RESET_ALL}
-
-  • {Fore.GREEN}Con código de país:{Fore.WHITE} +52 55 1234 5678, +1 555 123 4567
-  • {Fore.GREEN}Sin espacios:{Fore.WHITE} 5215512345678
-  • {Fore.GREEN}Con paréntesis:{Fore.WHITE} (555) 123-4567
-
-{Fore.YELLOW}CONFIGURACIÓN REQUERIDA:{Style.RESET_ALL}
-
-  1. Crear archivo {Fore.MAGENTA}.env{Style.RESET_ALL} en el directorio del proyecto
-  2. Añadir las siguientes variables:
-     {Fore.GREEN}RAPIDAPI_KEY={Fore.WHITE}tu_clave_api_aqui
-     {Fore.GREEN}RAPIDAPI_HOST={Fore.WHITE}whatsapp-data.p.rapidapi.com
-
-{Fore.YELLOW}ARCHIVOS GENERADOS:{Style.RESET_ALL}
-
-  • {Fore.MAGENTA}whatSPY.log{Fore.WHITE} - Registro detallado de actividades
-  • {Fore.MAGENTA}whatsapp_data_*.json{Fore.WHITE} - Resultados de consultas
-
-{Fore.YELLOW}FUNCIONALIDADES PRINCIPALES:{Style.RESET_ALL}
-
-  ✅ Validación automática de números de teléfono
-  ✅ Formato JSON con colores para mejor lectura
-  ✅ Guardado automático de resultados
-  ✅ Sistema de logging completo
-  ✅ Manejo robusto de errores de red
-  ✅ Interfaz colorida y fácil de usar
-
-{Fore.YELLOW}CONSEJOS:{Style.RESET_ALL}
-
-  • Siempre incluye el código de país en el número
-  • Revisa los logs si encuentras errores
-  • Los resultados se guardan automáticamente con timestamp
-{Style.RESET_ALL}
-        """
-        print(help_text)
+        print(_HELP)
     
     def clear_screen(self) -> None:
-        """Limpiar pantalla."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Limpiar pantalla escribiendo la secuencia ANSI directamente."""
+        # Vía de escape para consolas donde ni colorama interpreta ANSI
+        if os.environ.get('WHATSPY_LEGACY_CLEAR'):
+            os.system('cls' if os.name == 'nt' else 'clear')
+            return
+        # Colorama ya traduce las secuencias ANSI en consolas Windows
+        # antiguas, así que no hace falta lanzar un proceso cls/clear.
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
     
     def show_logs(self) -> None:
         """Mostrar las últimas líneas del log con formato mejorado."""
         try:
-            # Intentar abrir el archivo con diferentes codificaciones
-            try:
-                with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-            except UnicodeDecodeError:
-                try:
-                    with open(LOG_FILE, 'r', encoding='latin-1') as f:
-                        lines = f.readlines()
-                except Exception:
-                    with open(LOG_FILE, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-                        
-            # Obtener las últimas líneas
-            recent_lines = lines[-MAX_LOG_LINES:] if len(lines) > MAX_LOG_LINES else lines
+            # Leer solo la cola del archivo: el costo no crece con el log
+            recent_lines = [
+                raw.decode('utf-8', errors='replace')
+                for raw in _tail(LOG_FILE, MAX_LOG_LINES)
+            ]
 
             print(f"\n{Fore.CYAN}╔{'═' * 70}╗")
             print(f"║{' ' * 25}📋 REGISTRO DE ACTIVIDADES 📋{' ' * 25}║")
@@ -433,19 +975,12 @@ class WhatSPY:
 
             for i, line in enumerate(recent_lines, 1):
                 line = line.strip()
-                if 'ERROR' in line or 'CRITICAL' in line:
-                    color = Fore.RED
-                    icon = "❌"
-                elif 'WARNING' in line:
-                    color = Fore.YELLOW  
-                    icon = "⚠️"
-                elif 'INFO' in line:
-                    color = Fore.GREEN
-                    icon = "ℹ️"
+                match = _LEVEL_RE.search(line)
+                if match:
+                    color, icon = _LEVEL_STYLE[match.group(1)]
                 else:
-                    color = Fore.WHITE
-                    icon = "📝"
-                
+                    color, icon = _DEFAULT_LEVEL_STYLE
+
                 print(f"{Fore.CYAN}[{i:2d}]{color} {icon} {line}{Style.RESET_ALL}")
 
             print(f"\n{Fore.CYAN}{'─' * 70}{Style.RESET_ALL}")
@@ -464,59 +999,75 @@ class WhatSPY:
         """Ejecutar el programa principal."""
         self.clear_screen()
         self.show_banner()
-        
-        while True:
-            choice = self.show_menu()
-            
-            if choice == 1:
-                # Consultar número
-                phone = input(f"\n{Fore.GREEN}Introduce el número de teléfono (con código de país): {Style.RESET_ALL}")
-                if self.validate_phone_number(phone):
-                    self.query_whatsapp_number(phone)
-                else:
-                    print(f"{Fore.RED}Número de teléfono inválido. Verifica el formato.{Style.RESET_ALL}")
-                input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
+
+        try:
+            while True:
+                choice = self.show_menu()
+
+                if choice == 1:
+                    # Consultar número
+                    phone = input(f"\n{Fore.GREEN}Introduce el número de teléfono (con código de país): {Style.RESET_ALL}")
+                    if self.validate_phone_number(phone):
+                        self.query_whatsapp_number(phone)
+                    else:
+                        print(f"{Fore.RED}Número de teléfono inválido. Verifica el formato.{Style.RESET_ALL}")
+                    input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
                 
-            elif choice == 2:
-                # Consultar y guardar
-                phone = input(f"\n{Fore.GREEN}Introduce el número de teléfono (con código de país): {Style.RESET_ALL}")
-                if self.validate_phone_number(phone):
-                    self.query_whatsapp_number(phone, save_to_file=True)
-                else:
-                    print(f"{Fore.RED}Número de teléfono inválido. Verifica el formato.{Style.RESET_ALL}")
-                input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
+                elif choice == 2:
+                    # Consultar y guardar
+                    phone = input(f"\n{Fore.GREEN}Introduce el número de teléfono (con código de país): {Style.RESET_ALL}")
+                    if self.validate_phone_number(phone):
+                        self.query_whatsapp_number(phone, save_to_file=True)
+                    else:
+                        print(f"{Fore.RED}Número de teléfono inválido. Verifica el formato.{Style.RESET_ALL}")
+                    input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
                 
-            elif choice == 3:
-                # Ver logs
-                self.show_logs()
-                input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
+                elif choice == 3:
+                    # Ver logs
+                    self.show_logs()
+                    input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
                 
-            elif choice == 4:
-                # Limpiar pantalla
-                self.clear_screen()
-                self.show_banner()
+                elif choice == 4:
+                    # Limpiar pantalla
+                    self.clear_screen()
+                    self.show_banner()
                 
-            elif choice == 5:
-                # Ayuda
-                self.show_help()
-                input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
+                elif choice == 5:
+                    # Ayuda
+                    self.show_help()
+                    input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
                 
-            elif choice == 0:
-                # Salir
-                print(f"\n{Fore.GREEN}{'=' * 50}")
-                print(f"🎉 ¡Gracias por usar WhatSPY! 🎉")
-                print(f"{'=' * 50}")
-                print(f"{Fore.CYAN}📧 Desarrollado por: {Fore.RED}B4sal")
-                print(f"{Fore.CYAN}🌟 GitHub: {Fore.BLUE}https://github.com/B4sal/whatS.PY")
-                print(f"{Fore.YELLOW}⭐ ¡No olvides darle una estrella al proyecto!")
-                print(f"{'=' * 50}{Style.RESET_ALL}")
-                logger.info("Programa terminado por el usuario")
-                break
+                elif choice == 6:
+                    # Consulta por lotes
+                    file_path = input(f"\n{Fore.GREEN}Introduce la ruta del archivo con números (uno por línea): {Style.RESET_ALL}")
+                    self.batch_query_from_file(file_path.strip())
+                    input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
+
+                elif choice == 7:
+                    # Limpiar caché
+                    self.clear_cache()
+                    input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
+
+                elif choice == 0:
+                    # Salir
+                    print(f"\n{Fore.GREEN}{'=' * 50}")
+                    print(f"🎉 ¡Gracias por usar WhatSPY! 🎉")
+                    print(f"{'=' * 50}")
+                    print(f"{Fore.CYAN}📧 Desarrollado por: {Fore.RED}B4sal")
+                    print(f"{Fore.CYAN}🌟 GitHub: {Fore.BLUE}https://github.com/B4sal/whatS.PY")
+                    print(f"{Fore.YELLOW}⭐ ¡No olvides darle una estrella al proyecto!")
+                    print(f"{'=' * 50}{Style.RESET_ALL}")
+                    logger.info("Programa terminado por el usuario")
+                    break
                 
-            else:
-                if choice != -1:
-                    print(f"{Fore.RED}Opción inválida. Por favor selecciona una opción del menú.{Style.RESET_ALL}")
-                input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
+                else:
+                    if choice != -1:
+                        print(f"{Fore.RED}Opción inválida. Por favor selecciona una opción del menú.{Style.RESET_ALL}")
+                    input(f"\n{Fore.CYAN}Presiona Enter para continuar...{Style.RESET_ALL}")
+
+        finally:
+            # Liberar las conexiones keep-alive al salir
+            self.close()
 
 
 def main():
@@ -529,7 +1080,7 @@ def main():
         logger.info("Programa interrumpido por el usuario (Ctrl+C)")
     except Exception as e:
         print(f"\n{Fore.RED}Error crítico: {e}{Style.RESET_ALL}")
-        logger.critical(f"Error crítico: {e}")
+        logger.critical("Error crítico: %s", e)
 
 
 if __name__ == "__main__":